@@ -1,22 +1,55 @@
 # backend/compressor/core.py
+import functools
 import io
+import os
 import struct
+import threading
 import zlib
 from typing import Tuple, Dict
 
 import numpy as np
+import zstandard as zstd
 from PIL import Image
-from scipy.fftpack import dct, idct
+from scipy.fftpack import dct
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:   # numba is optional, the numpy path is used without it
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+    prange = range
+
+# Kernel launches are serialized on purpose: each launch already spreads its
+# blocks over every core, so concurrent compressions (e.g. the tasks.py pool)
+# queue here rather than oversubscribing the CPU or racing the numba runtime.
+_NUMBA_LOCK = threading.Lock()
 
 # --- Helpers ---------------------------------------------------------------
 
-MAGIC = b"MC2v1"   # math-compress v1
+MAGIC = b"MC2v3"   # math-compress v3: one zstd stream of R,G,B int16 coefficients
+_MAGIC_V2 = b"MC2v2"   # v2 stored an npz payload as-is
+_MAGIC_V1 = b"MC2v1"   # v1 wrapped the npz payload in a second zlib pass
+
+ZSTD_LEVEL = 5
+
+# zlib level for the base / reconstructed PNGs. optimize=True costs a slow
+# extra pass for a few percent of bytes; level 6 gets nearly all of the savings.
+PNG_COMPRESS_LEVEL = 6
+
+# orthonormal 8x8 DCT-II basis: the 2D DCT of a block is D8 @ b @ D8.T
+_D8 = dct(np.eye(8, dtype=np.float32), type=2, norm='ortho', axis=0)
+_D8T = np.ascontiguousarray(_D8.T)
 
 def _dct2(block):
-    return dct(dct(block.T, norm='ortho').T, norm='ortho')
+    # block may be a single (8,8) block or a (N,8,8) stack, matmul broadcasts
+    return _D8 @ block @ _D8T
 
 def _idct2(block):
-    return idct(idct(block.T, norm='ortho').T, norm='ortho')
+    return _D8T @ block @ _D8
 
 # standard JPEG-like 8x8 quant matrix (base)
 # currently not in use as of its for JPG we dont need for PNG
@@ -45,29 +78,178 @@ _ZIGZAG_IDX = np.array([
 
 _ZIGZAG_POS = np.argsort(_ZIGZAG_IDX)  # index -> (i,j) position via reshape
 
+@functools.lru_cache(maxsize=128)
 def quant_matrix(quality: int) -> np.ndarray:
+    # cached per quality, so the returned matrix is read-only
     q = _Q50.copy()
     # quality scaling (JPEG-like)
     if quality < 50:
         scale = 50.0 / quality
     else:
         scale = 2.0 - (quality / 50.0)
-    q = np.clip(np.round(q * scale), 1, 255)
-    return q.astype(np.float32)
-
-def _blockify(channel: np.ndarray, block=8):
-    H, W = channel.shape
+    q = np.clip(np.round(q * scale), 1, 255).astype(np.float32)
+    q.setflags(write=False)
+    return q
+
+# Arai-Agui-Nakajima scaled 8-point DCT (the float codec of IJG libjpeg).
+# Its outputs are the true coefficients scaled by 8 * s[u] * s[v]; that scale
+# is folded into the quant tables below so the scalar kernels pay nothing for it.
+_AAN_SCALE = np.array([1.0] + [np.cos(k * np.pi / 16) * np.sqrt(2) for k in range(1, 8)])
+_AAN_OUTER = np.outer(_AAN_SCALE, _AAN_SCALE)
+
+@functools.lru_cache(maxsize=128)
+def _aan_quant_tables(quality: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(forward multipliers, inverse multipliers) for the AAN kernels, read-only."""
+    Q = quant_matrix(quality).astype(np.float64)
+    fwd = (1.0 / (Q * _AAN_OUTER * 8.0)).astype(np.float32)
+    inv = (Q * _AAN_OUTER / 8.0).astype(np.float32)
+    fwd.setflags(write=False)
+    inv.setflags(write=False)
+    return fwd, inv
+
+@njit(fastmath=True, cache=True)
+def _fdct_aan_1d(v):
+    tmp0 = v[0] + v[7]; tmp7 = v[0] - v[7]
+    tmp1 = v[1] + v[6]; tmp6 = v[1] - v[6]
+    tmp2 = v[2] + v[5]; tmp5 = v[2] - v[5]
+    tmp3 = v[3] + v[4]; tmp4 = v[3] - v[4]
+    # even part
+    tmp10 = tmp0 + tmp3; tmp13 = tmp0 - tmp3
+    tmp11 = tmp1 + tmp2; tmp12 = tmp1 - tmp2
+    v[0] = tmp10 + tmp11
+    v[4] = tmp10 - tmp11
+    z1 = (tmp12 + tmp13) * 0.707106781
+    v[2] = tmp13 + z1
+    v[6] = tmp13 - z1
+    # odd part
+    tmp10 = tmp4 + tmp5; tmp11 = tmp5 + tmp6; tmp12 = tmp6 + tmp7
+    z5 = (tmp10 - tmp12) * 0.382683433
+    z2 = 0.541196100 * tmp10 + z5
+    z4 = 1.306562965 * tmp12 + z5
+    z3 = tmp11 * 0.707106781
+    z11 = tmp7 + z3; z13 = tmp7 - z3
+    v[5] = z13 + z2
+    v[3] = z13 - z2
+    v[1] = z11 + z4
+    v[7] = z11 - z4
+
+@njit(fastmath=True, cache=True)
+def _idct_aan_1d(v):
+    # even part
+    tmp10 = v[0] + v[4]; tmp11 = v[0] - v[4]
+    tmp13 = v[2] + v[6]
+    tmp12 = (v[2] - v[6]) * 1.414213562 - tmp13
+    tmp0 = tmp10 + tmp13; tmp3 = tmp10 - tmp13
+    tmp1 = tmp11 + tmp12; tmp2 = tmp11 - tmp12
+    # odd part
+    z13 = v[5] + v[3]; z10 = v[5] - v[3]
+    z11 = v[1] + v[7]; z12 = v[1] - v[7]
+    tmp7 = z11 + z13
+    tmp11 = (z11 - z13) * 1.414213562
+    z5 = (z10 + z12) * 1.847759065
+    tmp10 = 1.082392200 * z12 - z5
+    tmp12 = -2.613125930 * z10 + z5
+    tmp6 = tmp12 - tmp7
+    tmp5 = tmp11 - tmp6
+    tmp4 = tmp10 + tmp5
+    v[0] = tmp0 + tmp7; v[7] = tmp0 - tmp7
+    v[1] = tmp1 + tmp6; v[6] = tmp1 - tmp6
+    v[2] = tmp2 + tmp5; v[5] = tmp2 - tmp5
+    v[4] = tmp3 + tmp4; v[3] = tmp3 - tmp4
+
+@njit(fastmath=True, cache=True)
+def _fdct_aan_8x8(block):
+    # in place on an (8,8) float32 buffer: rows, then columns
+    for r in range(8):
+        _fdct_aan_1d(block[r])
+    for c in range(8):
+        _fdct_aan_1d(block[:, c])
+
+@njit(fastmath=True, cache=True)
+def _idct_aan_8x8(block):
+    for r in range(8):
+        _idct_aan_1d(block[r])
+    for c in range(8):
+        _idct_aan_1d(block[:, c])
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _encode_blocks_numba(blocks, Qf, zigzag_pos):
+    # (num_blocks, 8, 8) residual blocks -> (num_blocks, 64) zigzag ordered int16 coefficients
+    num_blocks = blocks.shape[0]
+    coef_array = np.empty((num_blocks, 64), dtype=np.int16)
+    for idx in prange(num_blocks):
+        blk = blocks[idx].astype(np.float32)
+        _fdct_aan_8x8(blk)
+        # quantize + zigzag
+        for k in range(64):
+            p = zigzag_pos[k]
+            coef_array[idx, k] = np.int16(np.rint(blk[p // 8, p % 8] * Qf[p // 8, p % 8]))
+    return coef_array
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _decode_blocks_numba(coef_array, Qi, zigzag_pos):
+    # coef_array (num_blocks, 64) zigzag ordered -> (num_blocks, 8, 8) residual blocks
+    num_blocks = coef_array.shape[0]
+    blocks = np.empty((num_blocks, 8, 8), dtype=np.float32)
+    for idx in prange(num_blocks):
+        # inverse zigzag + dequantize
+        dq = blocks[idx]
+        for k in range(64):
+            p = zigzag_pos[k]
+            dq[p // 8, p % 8] = coef_array[idx, k] * Qi[p // 8, p % 8]
+        # inverse DCT
+        _idct_aan_8x8(dq)
+    return blocks
+
+# Optional GPU backend (PyTorch + CUDA) for the batched transforms. Opt in with
+# RAPIDZIP_GPU=1; small images stay on the CPU where the host/device copy dominates.
+GPU_MIN_PIXELS = 10_000_000
+
+def _use_gpu(num_pixels: int) -> bool:
+    if os.environ.get("RAPIDZIP_GPU") != "1" or num_pixels < GPU_MIN_PIXELS:
+        return False
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+def _encode_blocks_gpu(blocks: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    # (..., 8, 8) residual blocks -> (..., 64) zigzag ordered int16 coefficients
+    import torch
+    t = torch.from_numpy(np.asarray(blocks, dtype=np.float32)).cuda()
+    D = torch.tensor(_D8, device="cuda")
+    q = torch.round((D @ t @ D.T) / torch.tensor(Q, device="cuda"))
+    zigzag = torch.tensor(_ZIGZAG_POS, device="cuda")
+    q = q.reshape(*q.shape[:-2], 64)[..., zigzag]
+    return q.to(torch.int16).cpu().numpy()
+
+def _decode_blocks_gpu(coef_array: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    # (num_blocks, 64) zigzag ordered coefficients -> (num_blocks, 8, 8) residual blocks
+    import torch
+    c = torch.from_numpy(np.array(coef_array, dtype=np.float32)).cuda()
+    q = torch.empty_like(c)
+    q[:, torch.tensor(_ZIGZAG_POS, device="cuda")] = c
+    dq = q.reshape(-1, 8, 8) * torch.tensor(Q, device="cuda")
+    D = torch.tensor(_D8, device="cuda")
+    return (D.T @ dq @ D).cpu().numpy()
+
+def _blockify_array(channels: np.ndarray, block=8) -> np.ndarray:
+    # (..., H, W) -> zero padded (..., num_blocks, block, block), blocks in row-major order
+    *lead, H, W = channels.shape
     H2 = ((H + block - 1) // block) * block
     W2 = ((W + block - 1) // block) * block
-    padded = np.zeros((H2, W2), dtype=channel.dtype)
-    padded[:H, :W] = channel
-    # yield block coordinates and block array
-    for i in range(0, H2, block):
-        for j in range(0, W2, block):
-            yield (i, j, padded[i:i+block, j:j+block])
-
-def _unblockify(recon_padded, orig_h, orig_w):
-    return recon_padded[:orig_h, :orig_w]
+    padded = np.zeros((*lead, H2, W2), dtype=channels.dtype)
+    padded[..., :H, :W] = channels
+    view = padded.reshape(*lead, H2 // block, block, W2 // block, block)
+    return view.swapaxes(-3, -2).reshape(*lead, -1, block, block)
+
+def _unblockify(blocks, orig_h, orig_w, block=8):
+    # inverse of _blockify_array, cropped back to (orig_h, orig_w)
+    H2 = ((orig_h + block - 1) // block) * block
+    W2 = ((orig_w + block - 1) // block) * block
+    view = blocks.reshape(H2 // block, W2 // block, block, block)
+    return view.swapaxes(1, 2).reshape(H2, W2)[:orig_h, :orig_w]
 
 # --- Serialization helpers ------------------------------------------------
 
@@ -77,11 +259,27 @@ def _pack_header(w:int, h:int, channels:int, block_size:int, down:int, quality:i
 
 def _unpack_header(f) -> Dict:
     magic = f.read(len(MAGIC))
-    if magic != MAGIC:
-        raise ValueError("Not an MC2v1 file")
+    if magic not in (MAGIC, _MAGIC_V2, _MAGIC_V1):
+        raise ValueError("Not an MC2 file")
     buf = f.read(struct.calcsize(">II4B Q"))
     w, h, channels, block_size, down, quality, base_len = struct.unpack(">II4B Q", buf)
-    return {"w": w, "h": h, "channels": channels, "block_size": block_size, "down": down, "quality": quality, "base_len": base_len}
+    return {"magic": magic, "w": w, "h": h, "channels": channels, "block_size": block_size, "down": down, "quality": quality, "base_len": base_len}
+
+def _pack_coefs(coefs: np.ndarray) -> bytes:
+    # coefs (3, num_blocks, 64) int16 -> num_blocks (I) | zstd(little-endian int16 R,G,B)
+    raw = np.ascontiguousarray(coefs, dtype="<i2").tobytes()
+    return struct.pack(">I", coefs.shape[1]) + zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+
+def _unpack_coefs(magic: bytes, payload: bytes) -> np.ndarray:
+    if magic == MAGIC:
+        (num_blocks,) = struct.unpack(">I", payload[:4])
+        raw = zstd.ZstdDecompressor().decompress(payload[4:])
+        return np.frombuffer(raw, dtype="<i2").reshape(3, num_blocks, 64)
+    # v1/v2: npz with one array per channel (v1 carries an extra zlib layer)
+    if magic == _MAGIC_V1:
+        payload = zlib.decompress(payload)
+    npz = np.load(io.BytesIO(payload))
+    return np.stack([npz["r"], npz["g"], npz["b"]], axis=0)
 
 # --- Core compress / decompress -------------------------------------------
 
@@ -96,71 +294,64 @@ def compress_image(path: str, quality: int = 50, down: int = 2) -> Tuple[str, Di
 
     # 1) Base layer: downsample + save as PNG bytes
     base_w, base_h = orig_w // down, orig_h // down
-    base = im.resize((base_w, base_h), resample=Image.LANCZOS)
+    # reducing_gap box-reduces first so Lanczos only runs on the last ~3x of the downscale
+    base = im.resize((base_w, base_h), resample=Image.Resampling.LANCZOS, reducing_gap=3.0)
     buf = io.BytesIO()
-    base.save(buf, format="PNG", optimize=True)
+    base.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     base_bytes = buf.getvalue()
     base_len = len(base_bytes)
 
-    # 2) Upsample base to compute residual
-    up_base = base.resize((orig_w, orig_h), resample=Image.BICUBIC)
-    orig_arr = np.asarray(im, dtype=np.float32)
-    up_arr = np.asarray(up_base, dtype=np.float32)
-    residual = orig_arr - up_arr   # can be negative
+    # 2) Upsample base to compute residual (must match the upsample in decompress_file)
+    up_base = base.resize((orig_w, orig_h), resample=Image.Resampling.BICUBIC)
+    orig_arr = np.asarray(im)
+    up_arr = np.asarray(up_base)
+    # int16 holds -255..255; the DCT stages cast to float32 per block / batch
+    residual = np.empty(orig_arr.shape, dtype=np.int16)
+    np.subtract(orig_arr, up_arr, out=residual, dtype=np.int16)   # can be negative
 
-    # 3) Transform & quantize residual per channel (8x8 DCT)
+    # 3) Transform & quantize residual (8x8 DCT), R,G,B stacked in one tensor
     Q = quant_matrix(quality)
     block_size = 8
 
-    # We'll store quantized coefficients as int16 arrays per channel, in zigzag order, flattened.
-    coef_arrays = []
-    H, W = orig_h, orig_w
-    for ch in range(3):   # R,G,B channels
-        ch_res = residual[:, :, ch]
-        flat_coefs = []
-        for (i, j, blk) in _blockify(ch_res, block_size):
-            if blk.shape != (8,8):
-                # pad to 8x8 (shouldn't happen because blockify pads)
-                padded = np.zeros((8,8), dtype=blk.dtype)
-                padded[:blk.shape[0], :blk.shape[1]] = blk
-                blk = padded
-            # forward DCT
-            d = _dct2(blk)
-            q = np.round(d / Q).astype(np.int16)   # quantized coefficients
-            # zigzag flatten
-            q_flat = q.flatten()[_ZIGZAG_POS]   # shape (64,)
-            flat_coefs.append(q_flat)
-        coef_arrays.append(np.stack(flat_coefs, axis=0).astype(np.int16))  # (num_blocks, 64)
-
-    # 4) Serialize coefficients: produce a single byte payload using numpy savez (then zlib compress)
+    # We'll store quantized coefficients as int16, (3, num_blocks, 64) in zigzag order.
+    blocks = _blockify_array(residual.transpose(2, 0, 1), block_size)   # (3, num_blocks, 8, 8)
+    num_blocks = blocks.shape[1]
+    if _use_gpu(orig_w * orig_h):
+        coefs = _encode_blocks_gpu(blocks, Q)
+    elif _HAVE_NUMBA:
+        Qf, _ = _aan_quant_tables(quality)
+        with _NUMBA_LOCK:
+            coefs = _encode_blocks_numba(blocks.reshape(-1, 8, 8), Qf, _ZIGZAG_POS)
+        coefs = coefs.reshape(3, num_blocks, 64)
+    else:
+        # forward DCT on every block of every channel at once
+        coeffs = _dct2(blocks)
+        # quantize in place on the fresh DCT output instead of allocating temporaries
+        np.divide(coeffs, Q, out=coeffs)
+        np.rint(coeffs, out=coeffs)
+        q_all = coeffs.astype(np.int16)   # quantized coefficients
+        # zigzag flatten every block in one gather (take keeps the result C-ordered)
+        coefs = q_all.reshape(3, num_blocks, 64).take(_ZIGZAG_POS, axis=2)
+
+    # 4) Serialize coefficients: R,G,B packed into one contiguous buffer, single zstd stream
     meta = {
         "orig_w": orig_w, "orig_h": orig_h, "down": down, "quality": quality, "block_size": block_size
     }
 
-    # pack: we will create a bytes blob containing arrays in order R,G,B using np.save to buffer
-    arr_buf = io.BytesIO()
-    # save three arrays with shapes using numpy savez
-    np.savez_compressed(arr_buf, r=coef_arrays[0], g=coef_arrays[1], b=coef_arrays[2])
-    arr_bytes = arr_buf.getvalue()
-
-    # compress residual bytes with zlib for extra shrinkage
-    compressed_payload = zlib.compress(arr_bytes, level=6)
+    compressed_payload = _pack_coefs(coefs)
 
-    # 5) create final file: header + base_len + base_bytes + payload
+    # 5) create final file: header + base_bytes + payload_len (8-bytes) + payload, in one write
     out_path = path.rsplit(".", 1)[0] + "_mc2.mcmp2"
+    header = _pack_header(orig_w, orig_h, channels, block_size, down, quality, base_len)
+    final = b"".join([header, base_bytes, struct.pack(">Q", len(compressed_payload)), compressed_payload])
     with open(out_path, "wb") as fo:
-        header = _pack_header(orig_w, orig_h, channels, block_size, down, quality, base_len)
-        fo.write(header)
-        fo.write(base_bytes)
-        # write payload length (8-bytes) then payload
-        fo.write(struct.pack(">Q", len(compressed_payload)))
-        fo.write(compressed_payload)
+        fo.write(final)
 
     stats = {
-        "original_bytes": len(open(path, "rb").read()),
+        "original_bytes": os.path.getsize(path),
         "base_bytes": base_len,
         "payload_bytes": len(compressed_payload),
-        "out_bytes": len(open(out_path, "rb").read()),
+        "out_bytes": os.path.getsize(out_path),
         "w": orig_w, "h": orig_h, "down": down, "quality": quality
     }
     return out_path, stats
@@ -184,54 +375,53 @@ def decompress_file(fobj) -> Tuple[bytes, Dict]:
     payload = fobj.read(payload_len)
 
     # decompress payload
-    arr_bytes = zlib.decompress(payload)
-    arr_buf = io.BytesIO(arr_bytes)
-    npz = np.load(arr_buf)
-
-    coef_r = npz["r"]  # shape (num_blocks, 64)
-    coef_g = npz["g"]
-    coef_b = npz["b"]
+    coef_r, coef_g, coef_b = _unpack_coefs(header["magic"], payload)  # each (num_blocks, 64)
 
     # reconstruct per channel blocks
     Q = quant_matrix(quality)
-    # compute number of blocks per row/col
-    blocks_per_row = ((w + block_size - 1) // block_size)
-    blocks_per_col = ((h + block_size - 1) // block_size)
-
-    def rebuild_channel(coef_array):
-        # coef_array shape (num_blocks,64)
-        recon_padded = np.zeros((blocks_per_col*block_size, blocks_per_row*block_size), dtype=np.float32)
-        idx = 0
-        for i in range(0, blocks_per_col*block_size, block_size):
-            for j in range(0, blocks_per_row*block_size, block_size):
-                flat = coef_array[idx]
-                idx += 1
-                # inverse zigzag
-                q = np.zeros(64, dtype=np.float32)
-                q[_ZIGZAG_POS] = flat
-                q = q.reshape((8,8))
-                # dequantize
-                d = q * Q
-                # inverse DCT
-                blk = _idct2(d)
-                recon_padded[i:i+8, j:j+8] = blk
-        return _unblockify(recon_padded, h, w)
-
-    rec_r = rebuild_channel(coef_r)
-    rec_g = rebuild_channel(coef_g)
-    rec_b = rebuild_channel(coef_b)
+    if _HAVE_NUMBA:
+        _, Qi = _aan_quant_tables(quality)
+    use_gpu = _use_gpu(w * h)
+
+    def rebuild_channel(coef_array, out):
+        # coef_array shape (num_blocks,64); writes the (h, w) residual into out
+        if use_gpu:
+            out[...] = _unblockify(_decode_blocks_gpu(coef_array, Q), h, w, block_size)
+            return
+        if _HAVE_NUMBA:
+            with _NUMBA_LOCK:
+                blocks = _decode_blocks_numba(coef_array, Qi, _ZIGZAG_POS)
+            out[...] = _unblockify(blocks, h, w, block_size)
+            return
+        num_blocks = len(coef_array)
+        # inverse zigzag for every block in one scatter
+        q = np.empty((num_blocks, 64), dtype=np.float32)
+        q[:, _ZIGZAG_POS] = coef_array
+        q = q.reshape(num_blocks, 8, 8)
+        # dequantize
+        dq = q * Q
+        # inverse DCT on every block at once
+        blocks = _idct2(dq)
+        out[...] = _unblockify(blocks, h, w, block_size)
+
+    recon_residual = np.empty((h, w, 3), dtype=np.float32)
+    rebuild_channel(coef_r, recon_residual[:, :, 0])
+    rebuild_channel(coef_g, recon_residual[:, :, 1])
+    rebuild_channel(coef_b, recon_residual[:, :, 2])
 
     # load base image and upsample
     base_img = Image.open(io.BytesIO(base_bytes)).convert("RGB")
-    up_base = base_img.resize((w, h), resample=Image.BICUBIC)
-    up_arr = np.asarray(up_base, dtype=np.float32)
+    up_base = base_img.resize((w, h), resample=Image.Resampling.BICUBIC)
+    up_arr = np.asarray(up_base)
 
     # reconstructed image = upsampled base + residual (clamp to [0,255])
-    recon = up_arr + np.stack([rec_r, rec_g, rec_b], axis=2)
-    recon = np.clip(np.round(recon), 0, 255).astype(np.uint8)
-    out_img = Image.fromarray(recon, mode="RGB")
+    recon = np.add(recon_residual, up_arr, out=recon_residual)
+    np.rint(recon, out=recon)
+    np.clip(recon, 0, 255, out=recon)
+    recon_u8 = recon.astype(np.uint8)
+    out_img = Image.fromarray(recon_u8, mode="RGB")
     out_buf = io.BytesIO()
-    out_img.save(out_buf, format="PNG", optimize=True)
+    out_img.save(out_buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     png_bytes = out_buf.getvalue()
 
     stats = {"w": w, "h": h, "down": down, "quality": quality, "recon_bytes": len(png_bytes)}
@@ -1,10 +1,9 @@
 from django.db import models
-import hashlib
 
 class CompressionRecord(models.Model):
     # Basic file details
     original_name = models.CharField(max_length=255)
-    file_hash = models.CharField(max_length=64, unique=True , blank=True)  # MD5 (or SHA256 if you prefer)
+    file_hash = models.CharField(max_length=64, unique=True , blank=True)  # SHA256 hex digest
     output_file = models.CharField(max_length=255, null=True, blank=True) 
     
     # Compression parameters
@@ -36,12 +35,3 @@ class CompressionRecord(models.Model):
 
     def __str__(self):
         return f"{self.original_name} (Q={self.quality}, down={self.down})"
-
-    @staticmethod
-    def compute_md5(file_path):
-        """Helper to compute MD5 hash for a given file."""
-        md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5.update(chunk)
-        return md5.hexdigest()
@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+
+from .core import compress_image
+from .models import CompressionRecord
+
+# Compression is CPU bound and takes seconds on large images, so it runs here
+# instead of on the request thread. The numpy/numba stages release the GIL.
+_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+# numba picks its threading layer on the first parallel kernel launch, which
+# happens on one of the pool threads above. With TBB that left the process
+# hanging at interpreter exit, so prefer OpenMP when it is available.
+try:
+    import numba
+    numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+except ImportError:
+    pass
+# Task state lives in this process only (see the readme's API section).
+# Finished tasks are dropped once reported, or after TASK_TTL seconds if the
+# client never comes back for them.
+TASK_TTL = 15 * 60
+_tasks = {}      # task_id -> Future
+_done_at = {}    # task_id -> time.monotonic() when the Future finished
+_tasks_lock = threading.Lock()
+
+
+def compress_image_task(tmp_path, original_name, file_hash, quality, down):
+    """Compress an uploaded file and store its CompressionRecord."""
+    try:
+        try:
+            out_path, stats = compress_image(tmp_path, quality=quality, down=down)
+        except Exception as e:
+            # keep uploaded file for debugging
+            raise RuntimeError(f'compression failed: {str(e)}')
+
+        try:
+            # the same file may have been uploaded twice while this one was compressing;
+            # file_hash is unique, so get_or_create hands the later one the existing row
+            rec, created = CompressionRecord.objects.get_or_create(
+                file_hash=file_hash,
+                defaults={
+                    'original_name': original_name,
+                    'quality': quality,
+                    'down': down,
+                    'original_size': stats['original_bytes'],
+                    'compressed_size': stats['out_bytes'],
+                    'payload_size': stats['payload_bytes'],
+                    'base_size': stats['base_bytes'],
+                    'width': stats['w'],
+                    'height': stats['h'],
+                    'output_file': os.path.basename(out_path),
+                }
+            )
+        except Exception as e:
+            raise RuntimeError(f'failed to save record: {str(e)}')
+
+        if not created:
+            # lost the race: nothing points at our copies, report the existing record instead
+            for path in (out_path, tmp_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            return {
+                'message': 'File already compressed',
+                'record_id': rec.id,
+                'download_url': f"/api/download/{rec.id}/",
+                'out_file': rec.output_file or os.path.basename(rec.original_name),
+                'stats': {
+                    'original_bytes': rec.original_size,
+                    'out_bytes': rec.compressed_size,
+                    'compression_ratio': rec.compression_ratio,
+                    'quality': rec.quality,
+                    'down': rec.down,
+                    'saved': round((1 - rec.compressed_size / rec.original_size) * 100, 2) if rec.original_size > 0 else 0
+                }
+            }
+
+        # Calculate saved percentage
+        stats['saved'] = round((1 - stats['out_bytes'] / stats['original_bytes']) * 100, 2) if stats['original_bytes'] > 0 else 0
+
+        return {
+            'message': 'Compression successful',
+            'record_id': rec.id,
+            'download_url': f"/api/download/{rec.id}/",
+            'out_file': os.path.basename(out_path),
+            'stats': stats
+        }
+    finally:
+        # worker threads get their own DB connection, don't leak it
+        connection.close()
+
+
+def _mark_done(task_id):
+    with _tasks_lock:
+        if task_id in _tasks:
+            _done_at[task_id] = time.monotonic()
+
+
+def _purge_expired():
+    cutoff = time.monotonic() - TASK_TTL
+    with _tasks_lock:
+        for task_id in [t for t, done_at in _done_at.items() if done_at < cutoff]:
+            _tasks.pop(task_id, None)
+            _done_at.pop(task_id, None)
+
+
+def submit_compression(tmp_path, original_name, file_hash, quality, down):
+    """Queue compress_image_task and return its task id."""
+    _purge_expired()
+    task_id = uuid.uuid4().hex
+    future = _executor.submit(compress_image_task, tmp_path, original_name, file_hash, quality, down)
+    with _tasks_lock:
+        _tasks[task_id] = future
+    future.add_done_callback(lambda f: _mark_done(task_id))
+    return task_id
+
+
+def get_task(task_id):
+    _purge_expired()
+    with _tasks_lock:
+        return _tasks.get(task_id)
+
+
+def forget_task(task_id):
+    with _tasks_lock:
+        _tasks.pop(task_id, None)
+        _done_at.pop(task_id, None)
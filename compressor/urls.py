@@ -4,4 +4,5 @@ from . import views
 urlpatterns = [
     path('compress/', views.compress_view, name='compress'),
     path('decompress/', views.decompress_view, name='decompress'),
+    path('status/<str:task_id>/', views.task_status, name='task_status'),
 ]
@@ -1,13 +1,15 @@
 import os
 import io
+import hashlib
 import random
 import string
 from django.http import JsonResponse, HttpResponse, FileResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
 from django.shortcuts import render
-from .core import compress_image, decompress_file
+from .core import decompress_file
 from .models import CompressionRecord
+from .tasks import submit_compression, get_task, forget_task
 
 
 def random_suffix(length=4):
@@ -34,19 +36,23 @@ def compress_view(request):
     tmp_name = f"{safe_name}_{random_suffix()}{ext}"
     tmp_path = os.path.join(settings.MEDIA_ROOT, tmp_name)
 
-    # Save uploaded file to media folder
+    # Save uploaded file to media folder, hashing it in the same pass
+    sha256 = hashlib.sha256()
     try:
         with open(tmp_path, 'wb+') as dest:
             for chunk in uploaded.chunks():
+                sha256.update(chunk)
                 dest.write(chunk)
     except Exception as e:
         return JsonResponse({'error': f'failed to save uploaded file: {str(e)}'}, status=500)
 
-    # Compute hash immediately
-    file_hash = CompressionRecord.compute_md5(tmp_path)
+    file_hash = sha256.hexdigest()
 
     # Check duplicate
-    existing = CompressionRecord.objects.filter(file_hash=file_hash).first()
+    existing = CompressionRecord.objects.filter(file_hash=file_hash).only(
+        'id', 'original_name', 'output_file', 'original_size', 'compressed_size',
+        'compression_ratio', 'quality', 'down'
+    ).first()
     if existing:
         out_file = existing.output_file or os.path.basename(existing.original_name)
         return JsonResponse({
@@ -68,40 +74,32 @@ def compress_view(request):
     quality = int(request.POST.get('quality', 50))
     down = int(request.POST.get('down', 2))
 
-    try:
-        out_path, stats = compress_image(tmp_path, quality=quality, down=down)
-    except Exception as e:
-        # keep uploaded file for debugging; return error
-        return JsonResponse({'error': f'compression failed: {str(e)}'}, status=500)
-
-    try:
-        rec = CompressionRecord.objects.create(
-            original_name=uploaded.name,
-            file_hash=file_hash,
-            quality=quality,
-            down=down,
-            original_size=stats['original_bytes'],
-            compressed_size=stats['out_bytes'],
-            payload_size=stats['payload_bytes'],
-            base_size=stats['base_bytes'],
-            width=stats['w'],
-            height=stats['h'],
-            output_file=os.path.basename(out_path)
-        )
-        
-        # Calculate saved percentage
-        stats['saved'] = round((1 - stats['out_bytes'] / stats['original_bytes']) * 100, 2) if stats['original_bytes'] > 0 else 0
-        
-    except Exception as e:
-        return JsonResponse({'error': f'failed to save record: {str(e)}'}, status=500)
+    # Compression runs on a worker, the client polls the status endpoint
+    task_id = submit_compression(tmp_path, uploaded.name, file_hash, quality, down)
 
     return JsonResponse({
-        'message': 'Compression successful',
-        'record_id': rec.id,
-        'download_url': f"/api/download/{rec.id}/",
-        'out_file': os.path.basename(out_path),
-        'stats': stats
-    })
+        'status': 'pending',
+        'task_id': task_id,
+        'status_url': f"/api/status/{task_id}/"
+    }, status=202)
+
+
+# ===================== TASK STATUS =====================
+def task_status(request, task_id):
+    """Poll a compression task queued by compress_view"""
+    future = get_task(task_id)
+    if future is None:
+        return JsonResponse({'error': 'Task not found'}, status=404)
+
+    if not future.done():
+        return JsonResponse({'status': 'pending', 'task_id': task_id}, status=202)
+
+    forget_task(task_id)
+    error = future.exception()
+    if error is not None:
+        return JsonResponse({'status': 'failed', 'error': str(error)}, status=500)
+
+    return JsonResponse({'status': 'done', **future.result()})
 
 
 # ===================== DECOMPRESSION =====================
@@ -131,14 +129,7 @@ def decompress_view(request):
     safe_base = base_name.replace(" ", "_")
     decompressed_name = f"{safe_base}_decompressed_{random_suffix()}.png"
 
-    out_path = os.path.join(settings.MEDIA_ROOT, decompressed_name)
-    try:
-        with open(out_path, 'wb') as out:
-            out.write(png_bytes)
-    except Exception as e:
-        return JsonResponse({'error': f'failed to save decompressed file: {str(e)}'}, status=500)
-
-    # Return the PNG directly as a downloadable file
+    # Return the PNG directly as a downloadable file (nothing reads it back, so it is not kept on disk)
     response = HttpResponse(png_bytes, content_type='image/png')
     response['Content-Disposition'] = f'attachment; filename="{decompressed_name}"'
     return response